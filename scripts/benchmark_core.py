@@ -0,0 +1,104 @@
+"""Record building for generate-benchmark.py.
+
+Kept in its own fully typed module so it can be compiled with mypyc:
+
+    cd scripts && mypyc benchmark_core.py
+
+mypyc writes the extension module to the current directory (and its
+intermediate files to build/ there), so run it from scripts/: the module
+then sits next to this file and is picked up by the normal import in
+preference to the source; nothing else changes.
+"""
+
+import sys
+from array import array
+from dataclasses import dataclass
+from itertools import starmap
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+Row = Tuple[str, Optional[Sequence[str]], int]
+
+# Flyweight pool: identical expected_contains sets share one tuple
+_EXPECTED_POOL: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+# Not frozen: mypyc-compiled frozen dataclasses reject their own __init__
+@dataclass(slots=True)
+class PromptRecord:
+    """Compact benchmark prompt; converted to a dict only when written out."""
+    prompt_id: str
+    prompt: str
+    expected_contains: Optional[Tuple[str, ...]]
+    scenario_id: str
+    max_tokens: int
+    category: str
+
+
+def _normalize(tuples: Sequence[Sequence[Any]], default_max: int) -> List[Row]:
+    """Pad short (prompt[, expected]) tuples to full (prompt, expected, max_tokens)."""
+    rows: List[Row] = []
+    for t in tuples:
+        n = len(t)
+        if n == 3:
+            rows.append((t[0], t[1], t[2]))
+        elif n == 2:
+            rows.append((t[0], t[1], default_max))
+        else:
+            rows.append((t[0], None, default_max))
+    return rows
+
+
+def _pooled(expected: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Intern keywords and return the pool's shared tuple for this set."""
+    if expected is None:
+        return None
+    # keywords recur across banks; share one string object per keyword
+    key = tuple([sys.intern(k) for k in expected])
+    return _EXPECTED_POOL.setdefault(key, key)
+
+
+@dataclass(slots=True)
+class PromptBank:
+    """Column-oriented (struct-of-arrays) prompt bank.
+
+    One tuple per field instead of one tuple per row; ``max_tokens`` is a
+    contiguous int16 ``array`` rather than a boxed int per row.
+    """
+    prompts: Tuple[str, ...]
+    expected: Tuple[Optional[Tuple[str, ...]], ...]
+    max_tokens: "array[int]"
+
+    @classmethod
+    def from_rows(cls, tuples: Sequence[Sequence[Any]], default_max: int = 200) -> "PromptBank":
+        rows = _normalize(tuples, default_max)
+        return cls(
+            prompts=tuple([r[0] for r in rows]),
+            expected=tuple([_pooled(r[1]) for r in rows]),
+            max_tokens=array("h", [r[2] for r in rows]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+    def __iter__(self) -> Iterator[Row]:
+        return zip(self.prompts, self.expected, self.max_tokens)
+
+
+def expand(
+    bank: Union[PromptBank, Sequence[Sequence[Any]]],
+    prefix: str,
+    scenario_id: str,
+    category: str,
+    default_max: int = 200,
+) -> List[PromptRecord]:
+    """Convert a bank (or compact (prompt, expected, max_tokens) tuples) to records."""
+    if not isinstance(bank, PromptBank):
+        bank = PromptBank.from_rows(bank, default_max)
+    ids = [f"{prefix}-{k:03d}" for k in range(1, len(bank) + 1)]
+    scenario_id = sys.intern(scenario_id)
+    category = sys.intern(category)
+
+    def build(prompt_id: str, text: str, expected: Optional[Tuple[str, ...]], max_tok: int) -> PromptRecord:
+        return PromptRecord(prompt_id, text, expected, scenario_id, max_tok, category)
+
+    return list(starmap(build, zip(ids, bank.prompts, bank.expected, bank.max_tokens)))
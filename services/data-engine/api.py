@@ -1,16 +1,29 @@
 """Data Engine API — serves promptsets and runs test harness."""
 
+import asyncio
+import functools
 import json
 import os
 import sys
 import uuid
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 
+# Optional orjson — faster promptset/manifest parsing, stdlib json works without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Both accept bytes, so files are read in binary mode
+_loads = orjson.loads if orjson is not None else json.loads
+
 # Add parent directory so we can import the harness
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "test-harness"))
 from harness import TestHarness, HarnessResult  # noqa: E402
@@ -21,9 +34,15 @@ app = FastAPI(title="Data Engine API", version="1.0.0")
 DATA_DIR = Path(os.getenv("DATA_DIR", "/app/data/promptsets"))
 GATEWAY_URL = os.getenv("GATEWAY_URL", "http://gateway.platform.svc.cluster.local:8000")
 
-# In-memory run store (survives for pod lifetime)
+# In-memory run store (survives for pod lifetime); beyond the limits the
+# oldest finished runs/benchmarks are dropped, pending/running ones never are
+_MAX_RUNS = 500
+_MAX_BENCHMARKS = 100
+_FINISHED = ("completed", "failed")
 _runs: Dict[str, dict] = {}
+_run_order: Deque[str] = deque()  # run_ids, oldest first
 _benchmarks: Dict[str, dict] = {}
+_benchmark_order: Deque[str] = deque()  # benchmark_ids, oldest first
 
 # Benchmark team → promptset mapping
 BENCHMARK_MAP = {
@@ -33,6 +52,44 @@ BENCHMARK_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def _load_manifest(path: str, mtime_ns: int) -> dict:
+    """Parse one manifest.json; mtime_ns in the key drops stale entries on rewrite.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _loads(Path(path).read_bytes())
+
+
+def _read_manifest(path: Path) -> dict:
+    """Parsed manifest, re-read only when the file has changed."""
+    return _load_manifest(str(path), path.stat().st_mtime_ns)
+
+
+def _find_manifest(subdir: Path) -> Optional[dict]:
+    """Parsed manifest of a promptset directory, or None when it has none."""
+    try:
+        return _read_manifest(subdir / "manifest.json")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _track(store: Dict[str, dict], order: Deque[str], key: str, limit: int) -> None:
+    """Record a newly stored key, then evict the oldest finished entries over limit."""
+    order.append(key)
+    while len(order) > limit:
+        oldest = next((k for k in order if store[k]["status"] in _FINISHED), None)
+        if oldest is None:
+            return  # everything still in flight; trim on a later insert
+        order.remove(oldest)
+        del store[oldest]
+
+
+def _track_run(run_id: str) -> None:
+    """Record a newly stored harness run (see _track)."""
+    _track(_runs, _run_order, run_id, _MAX_RUNS)
+
+
 # --------------- Models ---------------
 class PromptsetInfo(BaseModel):
     promptset_id: str
@@ -105,20 +162,22 @@ async def list_promptsets():
     if not DATA_DIR.exists():
         return promptsets
 
-    for subdir in sorted(DATA_DIR.iterdir()):
-        manifest_path = subdir / "manifest.json"
-        if manifest_path.exists():
-            with open(manifest_path) as f:
-                manifest = json.load(f)
-            promptsets.append(PromptsetInfo(
-                promptset_id=manifest.get("promptset_id", subdir.name),
-                scenario_id=manifest.get("scenario_id", "unknown"),
-                dataset_id=manifest.get("dataset_id", "unknown"),
-                prompt_count=manifest.get("prompt_count", 0),
-                created_at=manifest.get("created_at", ""),
-                version=manifest.get("version", "1.0.0"),
-                checksum=manifest.get("checksum", ""),
-            ))
+    subdirs = sorted(DATA_DIR.iterdir())
+    # Stat and read every manifest in worker threads, concurrently; the
+    # stat still happens per request, only the parse is cached
+    manifests = await asyncio.gather(*(asyncio.to_thread(_find_manifest, s) for s in subdirs))
+    for subdir, manifest in zip(subdirs, manifests):
+        if manifest is None:
+            continue
+        promptsets.append(PromptsetInfo(
+            promptset_id=manifest.get("promptset_id", subdir.name),
+            scenario_id=manifest.get("scenario_id", "unknown"),
+            dataset_id=manifest.get("dataset_id", "unknown"),
+            prompt_count=manifest.get("prompt_count", 0),
+            created_at=manifest.get("created_at", ""),
+            version=manifest.get("version", "1.0.0"),
+            checksum=manifest.get("checksum", ""),
+        ))
     return promptsets
 
 
@@ -134,17 +193,16 @@ async def get_promptset(name: str):
 
     manifest = {}
     if manifest_path.exists():
-        with open(manifest_path) as f:
-            manifest = json.load(f)
+        manifest = _read_manifest(manifest_path)
 
     # Load first 5 prompts as preview
     preview = []
     if promptset_path.exists():
-        with open(promptset_path) as f:
+        with open(promptset_path, "rb") as f:
             for i, line in enumerate(f):
                 if i >= 5:
                     break
-                preview.append(json.loads(line))
+                preview.append(_loads(line))
 
     return {"manifest": manifest, "preview": preview}
 
@@ -156,15 +214,11 @@ async def _execute_run(run_id: str, promptset_name: str, team: str,
     """Background task: run the harness and store results."""
     _runs[run_id]["status"] = "running"
     try:
-        # Load prompts
+        # Load prompts; quick runs only parse the first max_prompts lines
         promptset_path = DATA_DIR / promptset_name / "promptset.jsonl"
-        prompts = []
-        with open(promptset_path) as f:
-            for line in f:
-                prompts.append(json.loads(line))
-
-        if max_prompts and max_prompts < len(prompts):
-            prompts = prompts[:max_prompts]
+        with open(promptset_path, "rb") as f:
+            lines = islice(f, max_prompts) if max_prompts and max_prompts > 0 else f
+            prompts = [_loads(line) for line in lines]
 
         _runs[run_id]["total"] = len(prompts)
 
@@ -178,22 +232,27 @@ async def _execute_run(run_id: str, promptset_name: str, team: str,
             prompts, team, variant
         )
 
-        # Summarize
-        passed = sum(1 for r in results if r.passed)
-        failed = sum(1 for r in results if not r.passed)
-        avg_lat = sum(r.latency_ms for r in results) / len(results) if results else 0
-        avg_tps = sum(r.tokens_per_second for r in results) / len(results) if results else 0
-        errors = [f"{r.prompt_id}: {r.error}" for r in results if r.error]
-
-        # Category breakdown
+        # Summarize and break down by category in one pass over the results
+        passed = 0
+        sum_lat = sum_tps = 0.0
+        errors = []
         categories = {}
         for r in results:
-            cat = r.category or "uncategorized"
-            if cat not in categories:
-                categories[cat] = {"total": 0, "passed": 0}
-            categories[cat]["total"] += 1
+            name = r.category or "uncategorized"
+            cat = categories.get(name)
+            if cat is None:
+                cat = categories[name] = {"total": 0, "passed": 0}
+            cat["total"] += 1
             if r.passed:
-                categories[cat]["passed"] += 1
+                passed += 1
+                cat["passed"] += 1
+            sum_lat += r.latency_ms
+            sum_tps += r.tokens_per_second
+            if r.error:
+                errors.append(f"{r.prompt_id}: {r.error}")
+        failed = len(results) - passed
+        avg_lat = sum_lat / len(results) if results else 0
+        avg_tps = sum_tps / len(results) if results else 0
 
         _runs[run_id].update({
             "status": "completed",
@@ -230,8 +289,7 @@ async def start_harness_run(req: HarnessRunRequest, bg: BackgroundTasks):
             for subdir in DATA_DIR.iterdir():
                 mp = subdir / "manifest.json"
                 if mp.exists():
-                    with open(mp) as mf:
-                        manifest = json.load(mf)
+                    manifest = _read_manifest(mp)
                     if manifest.get("dataset_id") == req.promptset:
                         promptset_name = subdir.name
                         promptset_path = subdir / "promptset.jsonl"
@@ -257,6 +315,7 @@ async def start_harness_run(req: HarnessRunRequest, bg: BackgroundTasks):
         "completed_at": None,
         "errors": [],
     }
+    _track_run(run_id)
 
     bg.add_task(_execute_run, run_id, promptset_name, req.team,
                 req.variant, req.concurrency, req.max_prompts)
@@ -267,8 +326,8 @@ async def start_harness_run(req: HarnessRunRequest, bg: BackgroundTasks):
 @app.get("/harness/runs", response_model=List[HarnessRunSummary])
 async def list_runs():
     """List all harness runs (most recent first)."""
-    runs = sorted(_runs.values(), key=lambda r: r["started_at"], reverse=True)
-    return [HarnessRunSummary(**r) for r in runs[:50]]
+    # _run_order is already in start order; no sort needed
+    return [HarnessRunSummary(**_runs[i]) for i in islice(reversed(_run_order), 50)]
 
 
 @app.get("/harness/runs/{run_id}", response_model=HarnessRunSummary)
@@ -284,6 +343,9 @@ async def get_run(run_id: str):
 async def _execute_benchmark(benchmark_id: str, concurrency: int):
     """Run all 3 team benchmarks sequentially and aggregate results."""
     _benchmarks[benchmark_id]["status"] = "running"
+    # Hold the team runs here: once finished they're fair game for eviction
+    # from _runs while later teams are still running
+    team_results: Dict[str, dict] = {}
     try:
         for team, promptset_name in BENCHMARK_MAP.items():
             promptset_path = DATA_DIR / promptset_name / "promptset.jsonl"
@@ -295,7 +357,7 @@ async def _execute_benchmark(benchmark_id: str, concurrency: int):
             _benchmarks[benchmark_id]["team_runs"][team] = run_id
             _benchmarks[benchmark_id]["team_status"][team] = "running"
 
-            _runs[run_id] = {
+            run = _runs[run_id] = {
                 "run_id": run_id,
                 "status": "running",
                 "promptset": promptset_name,
@@ -310,25 +372,25 @@ async def _execute_benchmark(benchmark_id: str, concurrency: int):
                 "completed_at": None,
                 "errors": [],
             }
+            _track_run(run_id)
 
             await _execute_run(run_id, promptset_name, team, None, concurrency, None)
 
-            _benchmarks[benchmark_id]["team_status"][team] = _runs[run_id]["status"]
+            team_results[team] = run
+            _benchmarks[benchmark_id]["team_status"][team] = run["status"]
 
         # Aggregate summary
         summary = {}
-        for team, run_id in _benchmarks[benchmark_id]["team_runs"].items():
-            if run_id in _runs:
-                r = _runs[run_id]
-                summary[team] = {
-                    "total": r["total"],
-                    "passed": r["passed"],
-                    "failed": r["failed"],
-                    "pass_rate": r.get("pass_rate", 0),
-                    "avg_latency_ms": r.get("avg_latency_ms", 0),
-                    "avg_tokens_per_second": r.get("avg_tokens_per_second", 0),
-                    "category_breakdown": r.get("category_breakdown"),
-                }
+        for team, r in team_results.items():
+            summary[team] = {
+                "total": r["total"],
+                "passed": r["passed"],
+                "failed": r["failed"],
+                "pass_rate": r.get("pass_rate", 0),
+                "avg_latency_ms": r.get("avg_latency_ms", 0),
+                "avg_tokens_per_second": r.get("avg_tokens_per_second", 0),
+                "category_breakdown": r.get("category_breakdown"),
+            }
 
         all_failed = all(s == "failed" for s in _benchmarks[benchmark_id]["team_status"].values())
         _benchmarks[benchmark_id].update({
@@ -363,6 +425,7 @@ async def start_benchmark(req: BenchmarkRunRequest, bg: BackgroundTasks):
         "completed_at": None,
         "summary": None,
     }
+    _track(_benchmarks, _benchmark_order, benchmark_id, _MAX_BENCHMARKS)
 
     bg.add_task(_execute_benchmark, benchmark_id, req.concurrency)
     return BenchmarkRunSummary(**_benchmarks[benchmark_id])
@@ -1,12 +1,56 @@
 # services/data-engine/generator.py
+import os
 import json
 import hashlib
+import functools
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, List, Optional
 from dataclasses import dataclass, asdict
 import tiktoken
 
+# Optional orjson — faster promptset encoding, stdlib json works without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# promptset.jsonl file buffer; a whole promptset usually fits in one flush
+_WRITE_BUF = 1 << 20
+# Records encoded per joined promptset.jsonl write
+_WRITE_BATCH = 4096
+# Output-length buckets: inclusive upper token limits, one more name than limits
+_BUCKET_LIMITS = (75, 300)
+_BUCKET_NAMES = ("short", "medium", "long")
+
+
+def _dumps(obj) -> bytes:
+    """Encode a record (dict or dataclass) as compact UTF-8 JSON.
+
+    Compact separators are the format of the committed promptset.jsonl files
+    (and their manifest checksums); the stdlib fallback emits the same bytes
+    as orjson.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if hasattr(obj, "__dataclass_fields__"):
+        obj = asdict(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _dumps_indented(obj) -> bytes:
+    """Encode a dataclass as 2-space indented JSON (same bytes as json.dump(indent=2))."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(asdict(obj), indent=2).encode()
+
+
+@functools.lru_cache(maxsize=4096)
+def _encoded_len(encoder, text: str) -> int:
+    """Token count of text; repeated prompt texts are only tokenized once."""
+    return len(encoder.encode(text))
+
 
 @dataclass
 class Prompt:
@@ -43,57 +87,69 @@ class PromptsetGenerator:
 
     def __init__(self, seed: int = 42):
         self.seed = seed
-        self.encoder = tiktoken.get_encoding("cl100k_base")
+
+    @functools.cached_property
+    def encoder(self):
+        """cl100k_base encoder, loaded on first use; promptset writes never need it."""
+        return tiktoken.get_encoding("cl100k_base")
 
     def count_tokens(self, text: str) -> int:
         """Count tokens using tiktoken."""
-        return len(self.encoder.encode(text))
+        return _encoded_len(self.encoder, text)
 
     def assign_bucket(self, target_tokens: int) -> str:
         """Assign output length bucket."""
-        if target_tokens <= 75:
-            return "short"
-        elif target_tokens <= 300:
-            return "medium"
-        else:
-            return "long"
+        return _BUCKET_NAMES[bisect_left(_BUCKET_LIMITS, target_tokens)]
 
     def generate_promptset(
         self,
         scenario_id: str,
         dataset_id: str,
-        prompts: List[Dict],
+        prompts: Iterable[Dict],
         output_dir: Path
     ) -> Manifest:
         """Generate promptset files and manifest."""
 
-        # Process prompts
-        processed = []
-        for p in prompts:
-            prompt = Prompt(
-                prompt_id=p["prompt_id"],
-                prompt=p["prompt"],
-                scenario_id=scenario_id,
-                dataset_id=dataset_id,
-                expected_contains=p.get("expected_contains"),
-                expected_format=p.get("expected_format"),
-                target_output_tokens=p.get("target_output_tokens"),
-                bucket=self.assign_bucket(p.get("target_output_tokens", 50)),
-                category=p.get("category"),
-                split=p.get("split"),
-                metadata=p.get("metadata")
-            )
-            processed.append(prompt)
-
-        # Write promptset.jsonl
+        # Process and write promptset.jsonl as the prompts arrive (prompts may
+        # be a generator); encoded lines are joined and written in batches so
+        # memory stays bounded without one write() call per record
         promptset_path = output_dir / "promptset.jsonl"
-        with open(promptset_path, "w") as f:
-            for p in processed:
-                f.write(json.dumps(asdict(p)) + "\n")
-
-        # Calculate checksum
-        with open(promptset_path, "rb") as f:
-            checksum = f"sha256:{hashlib.sha256(f.read()).hexdigest()}"
+        prompt_count = 0
+        batch: List[bytes] = []
+        # Checksum is computed over the bytes as written; the file is not re-read
+        sha = hashlib.sha256()
+        with open(promptset_path, "wb", buffering=_WRITE_BUF) as f:
+            for p in prompts:
+                prompt = Prompt(
+                    prompt_id=p["prompt_id"],
+                    prompt=p["prompt"],
+                    scenario_id=scenario_id,
+                    dataset_id=dataset_id,
+                    expected_contains=p.get("expected_contains"),
+                    expected_format=p.get("expected_format"),
+                    target_output_tokens=p.get("target_output_tokens"),
+                    bucket=self.assign_bucket(p.get("target_output_tokens", 50)),
+                    category=p.get("category"),
+                    split=p.get("split"),
+                    metadata=p.get("metadata")
+                )
+                batch.append(_dumps(prompt))
+                if len(batch) == _WRITE_BATCH:
+                    chunk = b"\n".join(batch) + b"\n"
+                    f.write(chunk)
+                    sha.update(chunk)
+                    prompt_count += len(batch)
+                    batch.clear()
+            if batch:
+                chunk = b"\n".join(batch) + b"\n"
+                f.write(chunk)
+                sha.update(chunk)
+                prompt_count += len(batch)
+            # Durable before the manifest that records its checksum is written
+            f.flush()
+            os.fsync(f.fileno())
+
+        checksum = f"sha256:{sha.hexdigest()}"
 
         # Generate manifest
         manifest = Manifest(
@@ -102,7 +158,7 @@ class PromptsetGenerator:
             dataset_id=dataset_id,
             created_at=datetime.utcnow().isoformat() + "Z",
             seed=self.seed,
-            prompt_count=len(processed),
+            prompt_count=prompt_count,
             expected_output_schema={"format": "text"},
             target_buckets={
                 "input_tokens": {"min": 10, "max": 500},
@@ -115,7 +171,6 @@ class PromptsetGenerator:
 
         # Write manifest.json
         manifest_path = output_dir / "manifest.json"
-        with open(manifest_path, "w") as f:
-            json.dump(asdict(manifest), f, indent=2)
+        manifest_path.write_bytes(_dumps_indented(manifest))
 
         return manifest
@@ -15,6 +15,7 @@ from shared.telemetry import setup_telemetry
 from shared.genai_spans import GenAISpanContext
 from shared.debug_events import should_sample_details, prompt_hash, add_prompt_event, add_completion_event
 from scorer import EvalScorer
+from judge import close_judge_client
 
 
 # Request/Response Models
@@ -53,7 +54,7 @@ async def lifespan(app: FastAPI):
     yield
 
     # Cleanup
-    pass
+    await close_judge_client()
 
 
 # Create app
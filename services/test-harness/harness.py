@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from contextlib import contextmanager
+from functools import lru_cache
 
 # Optional OTEL — works without it for local runs
 try:
@@ -31,6 +32,16 @@ except ImportError:
     def otel_inject(headers): pass
 
 
+@lru_cache(maxsize=4096)
+def _match_terms(expected: tuple) -> tuple:
+    """Lower-case and de-duplicate an expected_contains set, once per distinct set.
+
+    Promptsets reuse the same keyword sets across many prompts (and list case
+    variants such as "cold"/"Cold"), so this is computed once, not per response.
+    """
+    return tuple(dict.fromkeys(term.lower() for term in expected))
+
+
 @dataclass
 class HarnessResult:
     prompt_id: str
@@ -212,8 +223,8 @@ class TestHarness:
         # Check expected_contains (skip if None or missing)
         expected = prompt.get("expected_contains")
         if expected:
-            for term in expected:
-                if term.lower() not in response_text:
+            for term in _match_terms(tuple(expected)):
+                if term not in response_text:
                     return False
 
         # Check expected_format
@@ -258,7 +269,7 @@ async def main():
 
     # Load promptset
     prompts = []
-    with open(args.promptset) as f:
+    with open(args.promptset, encoding="utf-8") as f:
         for line in f:
             prompts.append(json.loads(line))
 